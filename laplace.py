@@ -1,6 +1,74 @@
+from collections import OrderedDict
+from functools import lru_cache
+import math
+from math import lgamma, exp, log, ceil
+
 import numpy as np
 import scipy.integrate as integrate
-from scipy.special import hyp2f1
+from scipy.special import hyp2f1, poch, gamma, gammaln
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_VALID_METHODS = frozenset(('hyper', 'brute'))
+_BACKENDS = frozenset(('numpy', 'cupy', 'jax'))
+
+#--Memoized results, grouped by alpha: {a: {(s, j, n, method): D^n b_s^j(a)}}, least recently used alpha first
+_LC_CACHE = OrderedDict()
+_LC_CACHE_MAX_ALPHAS = 256
+
+def clear_cache():
+    """
+        Forget all memoized Laplace coefficients and derivatives.
+    """
+    _LC_CACHE.clear()
+
+def _alpha_cache(a):
+    """
+        The memoized values for this a, marked as most recently used. If there are none, a new empty dict
+        is returned, which only enters `_LC_CACHE` once `_store` puts something in it.
+    """
+    inner = _LC_CACHE.get(a)
+    if inner is None:
+        return {}
+    _LC_CACHE.move_to_end(a)
+    return inner
+
+def _store(inner, a, key, v):
+    """
+        Memoize v under key in `inner`, the dict returned by `_alpha_cache(a)`, evicting the least recently
+        used alpha once more than _LC_CACHE_MAX_ALPHAS are held.
+    """
+    if not inner:
+        _LC_CACHE[a] = inner
+        if len(_LC_CACHE) > _LC_CACHE_MAX_ALPHAS:
+            _LC_CACHE.popitem(last=False)
+    inner[key] = v
+    return v
+
+def _validate_inputs(a, s, method):
+    """
+        Check the arguments shared by `lc` and `dnlc` once, before entering the cached computations.
+        The hypergeometric series needs a < 1, while the integral of method "brute" is defined for any a != 1.
+    """
+    if method not in _VALID_METHODS:
+        raise ValueError(f"unknown method '{method}', expected 'hyper' or 'brute'")
+    if not s > 0:
+        raise ValueError(f"s must be positive, got {s}")
+    if method == 'hyper' and not 0 <= a < 1:
+        raise ValueError(f"alpha must satisfy 0 <= a < 1 with method 'hyper', got {a}")
+    if method == 'brute' and not (a >= 0 and a != 1):
+        raise ValueError(f"alpha must satisfy 0 <= a != 1 with method 'brute', got {a}")
+
+def _validate_order(n):
+    """
+        The order of derivative n as an int, which the tabulation uses as an index; integral floats are accepted.
+    """
+    if not float(n).is_integer():
+        raise ValueError(f"n must be an integer, got {n}")
+    return int(n)
 
 def lc(a, s, j, method='hyper'):
     """
@@ -12,17 +80,242 @@ def lc(a, s, j, method='hyper'):
             j = appears in argument \cos(j\theta).
             method: - "hyper" uses the hyperbolique function 2F1, see exercice 6.2 of Murray & Dermott.
                     - "brute" uses a slower brute-force integration, see eq. (6.67) of Murray & Dermott.
+
+        An array of a is handed over to `lc_vec`.
+    """
+    if not isinstance(a, float) and np.ndim(a):
+        return lc_vec(a, s, j, method)
+    _validate_inputs(a, s, method)
+    return _lc_cached(_alpha_cache(a), a, s, j, method)
+
+def _lc_cached(inner, a, s, j, method):
+    """
+        b_s^j(a), looked up in (and stored into) `inner`, the dict returned by `_alpha_cache(a)`.
+    """
+    key = (s, j, 0, method)
+    v = inner.get(key)
+    if v is None:
+        v = _store(inner, a, key, _lc_impl(a, s, j, method))
+    return v
+
+def _lc_impl(a, s, j, method):
+    if method == 'hyper':
+        j = abs(j)
+        a2 = a*a
+        if j == 0:
+            return 2 * hyp2f1(s, s, 1, a2)
+        return _lc_prefactor(s, j) * a**j * hyp2f1(s, s+j, j+1, a2)
+
+    if method == 'brute':
+        #--Trapezoidal rule, exponentially convergent for this smooth periodic integrand
+        N = _trap_size(a, j)
+        if N > _TRAP_MAX_NODES:
+            return _brute_quad(a, s, j)
+        if numba is not None:
+            return _brute_kernel(float(a), float(s), float(j), N)
+        t, cost = _trap_nodes(N)
+        vals = np.cos(j*t) * np.power(1 - 2*a*cost + a*a, -s)
+        return 2 * vals.mean()
+
+def _brute_quad(a, s, j):
+    """
+        Adaptive integration of eq. (6.67), for a so close to 1 that the trapezoidal rule would need more than
+        _TRAP_MAX_NODES nodes. The integrand is even and peaked at theta = 0 with a width of order |1-a|, so
+        only [0, pi] is integrated, with break points on that scale. The denominator is written
+        (1-a)^2 + 4a sin^2(theta/2) to avoid the cancellation of 1 - 2a cos(theta) + a^2 near theta = 0.
+    """
+    eps = abs(1 - a)
+    db = lambda t: np.cos(j*t)*np.power((1-a)**2 + 4*a*np.sin(t/2)**2, -s)
+    points = [eps * 10.**k for k in range(int(log(np.pi/eps, 10)) + 1)]
+    l,err = integrate.quad(db, 0., np.pi, points=points, limit=50*len(points))
+    return 2*l/np.pi
+
+def _lc_prefactor(s, j):
+    """
+        2 (s)_j / j!, the factor in front of a^j 2F1(s, s+j; j+1; a^2) in b_s^j(a), for j >= 0.
+        In practice s is a half-integer and j an integer, for which the values are tabulated.
+    """
+    two_s = 2*s
+    if two_s == int(two_s) and j == int(j):
+        return _lc_prefactor_half(int(two_s), int(j))
+    return 2.0 * exp(lgamma(s+j) - lgamma(s) - lgamma(j+1))
+
+@lru_cache(maxsize=None)
+def _lc_prefactor_half(two_s, j):
+    """
+        2 (s)_j / j! for s = two_s/2. Once (s)_j = Gamma(s+j)/Gamma(s) would overflow, it is computed in log space.
+    """
+    s = two_s * 0.5
+    if s + j <= 170:
+        return 2.0 * float(poch(s, j)) / math.factorial(j)
+    return 2.0 * exp(lgamma(s+j) - lgamma(s) - lgamma(j+1))
+
+def _lc_prefactor_vec(s, j):
+    """
+        `_lc_prefactor` for an array of j >= 0: the ratio poch(s, j) / j! while Gamma(s+j) fits in a double,
+        and log space beyond, where poch and gamma both overflow and their ratio would be nan.
+    """
+    j = np.asarray(j, dtype=np.float64)
+    c = np.empty(j.shape, dtype=np.float64)
+    small = s + j <= 170
+    c[small] = 2 * poch(s, j[small]) / gamma(j[small]+1)
+    big = ~small
+    c[big] = 2 * np.exp(gammaln(s+j[big]) - gammaln(s) - gammaln(j[big]+1))
+    return c
+
+_TRAP_MAX_NODES = 2**16
+
+def _trap_size(a, j):
+    """
+        Number of trapezoidal nodes for the brute-force integral. The quadrature error is dominated by the
+        aliased coefficients b_s^(N-|j|) ~ a^(N-|j|) (or a^-(N-|j|) for a > 1), so N grows with |j| and as
+        a approaches 1. Powers of two are used so that the nodes are shared between calls.
+    """
+    m = abs(j) + 16
+    if a > 0:
+        m += ceil(log(1e-16) / -abs(log(a)))
+    N = 64
+    while N < m:
+        N *= 2
+    return N
+
+@lru_cache(maxsize=None)
+def _trap_nodes(N):
+    t = np.linspace(0, 2*np.pi, N, endpoint=False)
+    return t, np.cos(t)
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _brute_kernel(a, s, j, N):
+        """
+            Compiled trapezoidal sum of eq. (6.67), without allocating the nodes.
+        """
+        total = 0.0
+        dt = 2*math.pi/N
+        for i in range(N):
+            t = i*dt
+            total += math.cos(j*t) * (1.0 - 2.0*a*math.cos(t) + a*a)**(-s)
+        return total*dt/math.pi
+
+def lc_vec(a, s, j, method='hyper', backend='numpy'):
     """
+        Laplace coefficients b_s^j(a) for arrays of a and j.
+
+        Arguments are those of `lc`, except that a and j may be arrays. They are broadcast against each other,
+        e.g. a[:, None] and j[None, :] for a grid of semi-major axis ratios and harmonics, and an array of the
+        broadcast shape is returned. With method "hyper" all coefficients are obtained from a single vectorized
+        evaluation of 2F1.
+            backend: - "numpy" evaluates on the CPU and returns a NumPy array.
+                     - "cupy" evaluates the "hyper" method on the GPU, one CUDA thread per coefficient, and returns a CuPy array.
+                       The CUDA kernel has not been run on a GPU yet, only a Python transcription of it; running this
+                       module as a script compares it with NumPy wherever CuPy is installed.
+                     - "jax" evaluates the "hyper" method with jax.scipy.special and returns a JAX array.
+                       Enable jax_enable_x64 for double precision.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"unknown backend '{backend}', expected 'numpy', 'cupy' or 'jax'")
+    if backend != 'numpy' and method != 'hyper':
+        raise ValueError(f"backend '{backend}' only supports method 'hyper'")
+    if np.ndim(a) == 0:
+        _validate_inputs(a, s, method)
+    elif method == 'hyper':
+        _validate_inputs(np.min(a), s, method)
+        _validate_inputs(np.max(a), s, method)
+
+    if backend == 'cupy':
+        return _lc_vec_cupy(a, s, j)
+    if backend == 'jax':
+        return _lc_vec_jax(a, s, j)
+    if np.ndim(a) == 0:
+        return _lc_vec(_alpha_cache(a), a, s, j, method)
     if method == 'hyper':
-        j = np.abs(j)
-        p = np.prod(np.arange(1,j+1)) #--Factorial j
-        q = np.prod(np.arange(s,s+j))
-        return 2 * (q/p) * np.power(a,j) * hyp2f1(s, s+j, j+1, a*a)
+        return _lc_vec(None, np.asarray(a), s, j, method)
+    a, j = np.broadcast_arrays(a, j)
+    for ai in np.unique(a):
+        _validate_inputs(ai, s, method)
+    return np.array([_lc_cached(_alpha_cache(ai), ai, s, ji, method) for ai, ji in zip(a.flat, j.flat)]).reshape(a.shape)
+
+def _lc_vec(inner, a, s, j, method):
+    j = np.abs(np.asarray(j))
+    if method == 'hyper':
+        return _lc_prefactor_vec(s, j) * np.power(a, j) * hyp2f1(s, s+j, j+1, a*a)
 
     if method == 'brute':
-        db = lambda t: np.cos(j*t)*np.power(1 - 2*a*np.cos(t) + a*a, -s)
-        l,err = integrate.quad(db, 0., 2.*np.pi)
-        return l/np.pi
+        return np.array([_lc_cached(inner, a, s, ji, method) for ji in j.flat], dtype=np.float64).reshape(j.shape)
+
+def lc_range(a, s, j_max, method='hyper'):
+    """
+        Laplace coefficients b_s^j(a) for j = 0, 1, ..., j_max.
+
+        Arguments are those of `lc`, with j_max a non-negative integer; an array of length j_max+1 is returned.
+        With method "hyper" only b_s^(j_max) and b_s^(j_max-1) are obtained from 2F1, the others follow from
+        the recurrence in j (see Brouwer & Clemence 1961)
+            (j+s-1) b_s^(j-1) = j (a + 1/a) b_s^j - (j-s+1) b_s^(j+1),
+        which is run downwards, the direction in which it is stable for the decreasing b_s^j.
+    """
+    _validate_inputs(a, s, method)
+    if j_max != int(j_max) or j_max < 0:
+        raise ValueError(f"j_max must be a non-negative integer, got {j_max}")
+    return _lc_range(_alpha_cache(a), a, s, 0, int(j_max), method)
+
+def _lc_range(inner, a, s, j_lo, j_hi, method):
+    """
+        b_s^j(a) for the integers j_lo <= j <= j_hi, with 0 <= j_lo.
+    """
+    b = np.empty(j_hi - j_lo + 1, dtype=np.float64)
+    if method == 'hyper' and a > 0 and len(b) > 2:
+        b[-1] = _lc_cached(inner, a, s, j_hi, method)
+        b[-2] = _lc_cached(inner, a, s, j_hi-1, method)
+        #--The seeds must not have underflowed, or the whole range would be lost
+        if b[-1] > 1e-300:
+            c = a + 1/a
+            for i in range(len(b)-2, 0, -1):
+                j = j_lo + i
+                b[i-1] = (j*c*b[i] - (j-s+1)*b[i+1]) / (j+s-1)
+            return b
+    b[:] = _lc_vec(inner, a, s, np.arange(j_lo, j_hi+1), method)
+    return b
+
+#--cupyx.scipy.special has no hyp2f1: each thread sums the Gauss series of its own coefficient
+_CUDA_LC_HYPER = r"""
+extern "C" __global__
+void lc_hyper(const double* a, const double* j, const double s, double* out, const long long size)
+{
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= size) return;
+    double ai = a[i], ji = j[i], z = ai*ai;
+    double term = 1.0, total = 1.0;
+    for (int k = 0; fabs(term) > 1e-16*fabs(total); k++) {
+        term *= (s+k)*(s+ji+k)*z / ((ji+1+k)*(k+1));
+        total += term;
+    }
+    out[i] = 2.0 * exp(lgamma(s+ji) - lgamma(s) - lgamma(ji+1)) * pow(ai, ji) * total;
+}
+"""
+
+@lru_cache(maxsize=None)
+def _cupy_kernel():
+    import cupy as cp
+    return cp.RawKernel(_CUDA_LC_HYPER, 'lc_hyper')
+
+def _lc_vec_cupy(a, s, j):
+    import cupy as cp
+    a, j = cp.broadcast_arrays(cp.asarray(a, dtype=cp.float64), cp.abs(cp.asarray(j, dtype=cp.float64)))
+    a, j = cp.ascontiguousarray(a), cp.ascontiguousarray(j)
+    out = cp.empty(a.shape, dtype=cp.float64)
+    if out.size:
+        threads = 256
+        blocks = (out.size + threads - 1) // threads
+        _cupy_kernel()((blocks,), (threads,), (a, j, cp.float64(s), out, cp.int64(out.size)))
+    return out
+
+def _lc_vec_jax(a, s, j):
+    import jax.numpy as jnp
+    from jax.scipy.special import gammaln, hyp2f1 as jax_hyp2f1
+    a = jnp.asarray(a, dtype=jnp.result_type(float))
+    a, j = jnp.broadcast_arrays(a, jnp.abs(jnp.asarray(j, dtype=a.dtype)))
+    coef = 2 * jnp.exp(gammaln(s+j) - gammaln(s) - gammaln(j+1)) * a**j
+    return coef * jax_hyp2f1(s, s+j, j+1, a*a)
 
 def dnlc(a, s, j, n=0, method='hyper'):
     """
@@ -35,23 +328,155 @@ def dnlc(a, s, j, n=0, method='hyper'):
             n = integer, order of the derivative. n=0 returns the Laplace coeffiicient. n<0 returns 0.
             method: - "hyper" uses the hyperbolique function 2F1, see exercice 6.2 of Murray & Dermott.
                     - "brute" uses a slower brute-force integration, see eq. (6.67) of Murray & Dermott.
+
+        An array of a returns an array of the same shape.
     """
+    if not isinstance(a, float) and np.ndim(a):
+        return np.array([dnlc(ai, s, j, n, method) for ai in np.ravel(a)], dtype=np.float64).reshape(np.shape(a))
+    _validate_inputs(a, s, method)
+    return _dnlc_cached(_alpha_cache(a), a, s, j, _validate_order(n), method)
+
+def _dnlc_cached(inner, a, s, j, n, method):
     if n<=0:
-        return max(0, n+1) * lc(a, s, j, method)
+        return max(0, n+1) * _lc_cached(inner, a, s, j, method)
+    key = (s, j, n, method)
+    v = inner.get(key)
+    if v is None:
+        if n <= 2 and method == 'hyper':
+            v = _dnlc_closed_form(a, s, j, n)
+        else:
+            v = _dnlc_tabulate(inner, a, s, j, j, n, n, method)[n, 0]
+        _store(inner, a, key, v)
+    return v
+
+def _dnlc_closed_form(a, s, j, n):
+    """
+        D^n b_s^j(a) for n = 1 or 2, by differentiating b_s^j = C a^j F(a^2) directly, with C = 2 (s)_j / j!,
+        F = 2F1(s, s+j; j+1; .) and F' = (s (s+j) / (j+1)) 2F1(s+1, s+j+1; j+2; .):
+            D   [a^j F] = j a^(j-1) F + 2 a^(j+1) F'
+            D^2 [a^j F] = j (j-1) a^(j-2) F + 2 (2j+1) a^j F' + 4 a^(j+2) F''
+        This takes two or three evaluations of 2F1 instead of the four or more of the recurrence.
+        At a = 0 the terms with a negative power of a are left out, as in the recurrence, which gives 0 there.
+    """
+    j = abs(j)
+    z = a*a
+    C = _lc_prefactor(s, j)
+    r1 = s*(s+j)/(j+1)
+    F1 = r1 * hyp2f1(s+1, s+j+1, j+2, z)
+    if n == 1:
+        d = 2 * a**(j+1) * F1
+        if j != 0 and (a != 0 or j >= 1):
+            d += j * a**(j-1) * hyp2f1(s, s+j, j+1, z)
     else:
-        return s*( dnlc(a, s+1 ,j-1, n-1, method) - 2*a*dnlc(a, s+1, j, n-1, method) + dnlc(a, s+1, j+1, n-1, method) - 2*(n-1)*dnlc(a, s+1 ,j, n-2, method))
+        F2 = r1 * (s+1)*(s+j+1)/(j+2) * hyp2f1(s+2, s+j+2, j+3, z)
+        d = 2*(2*j+1) * a**j * F1 + 4 * a**(j+2) * F2
+        if j*(j-1) != 0 and (a != 0 or j >= 2):
+            d += j*(j-1) * a**(j-2) * hyp2f1(s, s+j, j+1, z)
+    return C * d
+
+def dnlc_batch(a, s, queries, method='hyper'):
+    """
+        N-th derivatives of Laplace coefficients D^n b_s^j(a) for several (j, n) pairs.
 
+        Arguments:
+            a, s, method: as in `dnlc`, shared by all the queries.
+            queries = sequence (or array) of (j, n) pairs, with j and n as in `dnlc`.
+
+        Returns an array with one value per query, or for an array of a, an array of shape a.shape + (len(queries),).
+        Queries that `dnlc` answers without the recurrence (n = 0, and n <= 2 with method "hyper") go through the
+        same memoized closed forms; the others are read off one tabulation per set of j an integer apart, so the
+        Laplace coefficients they have in common are only computed once.
+    """
+    if not isinstance(a, float) and np.ndim(a):
+        return np.array([dnlc_batch(ai, s, queries, method) for ai in np.ravel(a)],
+                        dtype=np.float64).reshape(np.shape(a) + (len(queries),))
+    _validate_inputs(a, s, method)
+    queries = [(j, _validate_order(n)) for j, n in queries]
+    inner = _alpha_cache(a)
+    out = np.zeros(len(queries))
+    #--Queries left to the tabulation, grouped by the lowest j of the group, whose j are that j plus an integer
+    groups = {}
+    for i in sorted(range(len(queries)), key=lambda i: queries[i][0]):
+        j, n = queries[i]
+        if n < 0:
+            continue
+        if n == 0 or (n <= 2 and method == 'hyper') or (s, j, n, method) in inner:
+            out[i] = _dnlc_cached(inner, a, s, j, n, method)
+            continue
+        for j_lo in groups:
+            if j_lo + round(j - j_lo) == j:
+                groups[j_lo].append(i)
+                break
+        else:
+            groups[j] = [i]
+    for j_lo, rest in groups.items():
+        j_hi = max(queries[i][0] for i in rest)
+        n_lo = min(queries[i][1] for i in rest)
+        n_hi = max(queries[i][1] for i in rest)
+        D = _dnlc_tabulate(inner, a, s, j_lo, j_hi, n_lo, n_hi, method)
+        for i in rest:
+            j, n = queries[i]
+            col = round(j - j_lo)
+            assert j_lo + col == j
+            out[i] = _store(inner, a, (s, j, n, method), D[n, col])
+    return out
+
+def _dnlc_tabulate(inner, a, s, j_lo, j_hi, n_lo, n_hi, method):
+    """
+        Bottom-up evaluation of the recurrence
+            D^k b_s^j = s * ( D^(k-1) b_{s+1}^(j-1) - 2a D^(k-1) b_{s+1}^j + D^(k-1) b_{s+1}^(j+1) - 2(k-1) D^(k-2) b_{s+1}^j ).
+
+        T[m, k, i] holds D^k b_{s+m}^{j_lo-n_hi+i}(a). Each step in m consumes one order of derivative
+        (two for the last term) and widens the stencil in j by one, so level m only needs the orders
+        n_lo-2m <= k <= n_hi-m, and Laplace coefficients (k=0) are only needed for m >= n_lo/2.
+
+        Returns D[k, i] = D^k b_s^{j_lo+i}(a), valid for n_lo <= k <= n_hi and j_lo <= j_lo+i <= j_hi.
+
+        Entries outside the orders above are left uninitialized. Each row update works in place on
+        contiguous slices, the shifts in j being offsets of one element, and only the two edge columns,
+        which are read but never valid, are zeroed.
+    """
+    #--The recurrence in j of `lc_range` needs integer j; other j keep the direct evaluation of `lc_vec`
+    integral = j_lo == int(j_lo) and j_hi == int(j_hi)
+    if integral:
+        j_lo, j_hi = int(j_lo), int(j_hi)
+    jj = np.arange(j_lo - n_hi, j_hi + n_hi + 1)
+    if integral:
+        jj_abs = np.abs(jj)
+        jj_lo, jj_hi = int(jj_abs.min()), int(jj_abs.max())
+    T = np.empty((n_hi+1, n_hi+1, len(jj)), dtype=np.float64)
+    T[:, :, 0] = T[:, :, -1] = 0.
+    for m in range((n_lo+1)//2, n_hi+1):
+        if integral:
+            T[m, 0] = _lc_range(inner, a, s+m, jj_lo, jj_hi, method)[jj_abs - jj_lo]
+        else:
+            T[m, 0] = _lc_vec(inner, a, s+m, jj, method)
+    two_a = 2.0*a
+    for m in range(n_hi-1, -1, -1):
+        sm = s+m
+        for k in range(max(1, n_lo-2*m), n_hi-m+1):
+            d1 = T[m+1, k-1]
+            row = T[m, k, 1:-1]
+            np.add(d1[:-2], d1[2:], out=row)
+            row -= two_a * d1[1:-1]
+            if k >= 2:
+                row -= 2*(k-1) * T[m+1, k-2, 1:-1]
+            row *= sm
+    return T[0, :, n_hi:len(jj)-n_hi]
 
 if __name__ == '__main__':
     import prettytable as pt
     # Use Table 6.1 (page 263) of Murray & Dermott to check coefficents:
     a = 0.480597 # alpha near the 3:1 MMR
-    A0 = 0.5 * lc(a,0.5,0)
-    A1 = 0.125 * ( 2*a*dnlc(a,0.5,0,1) +  a*a*dnlc(a,0.5,0,2) )
-    A2 = -0.5 * a * lc(a,1.5,1)
-    A3 = 0.25 * ( 2*lc(a,0.5,1) - 2*a*dnlc(a,0.5,1,1) - a*a*dnlc(a,0.5,1,2) )
-    A4 = a * lc(a,1.5,1)
-    A5 = 0.125 * ( 21*lc(a,0.5,3) + 10*a*dnlc(a,0.5,3,1) + a*a*dnlc(a,0.5,3,2) )
+    #--All the s=1/2 coefficients and derivatives in one call
+    D00, D01, D02, D10, D11, D12, D30, D31, D32 = dnlc_batch(a, 0.5, [(j,n) for j in (0,1,3) for n in (0,1,2)])
+    b = lc(a,1.5,1)
+    A0 = 0.5 * D00
+    A1 = 0.125 * ( 2*a*D01 +  a*a*D02 )
+    A2 = -0.5 * a * b
+    A3 = 0.25 * ( 2*D10 - 2*a*D11 - a*a*D12 )
+    A4 = a * b
+    A5 = 0.125 * ( 21*D30 + 10*a*D31 + a*a*D32 )
     print()
     print("Code verification using Table 6.1 of Murray & Dermott")
     t = pt.PrettyTable(['i', 'A_i (code)',  'A_i (M&D)'], padding_width=3, junction_char='-')
@@ -64,3 +489,20 @@ if __name__ == '__main__':
     t.add_row(['5', A5, 0.598100] )
     print(t)
     print()
+    #--The optional backends of lc_vec against NumPy, wherever they are installed
+    import importlib.util
+    aa, jj = np.linspace(0.1, 0.9, 9)[:, None], np.arange(0, 20)[None, :]
+    ref = lc_vec(aa, 0.5, jj)
+    for backend in ('cupy', 'jax'):
+        if importlib.util.find_spec(backend) is None:
+            print(f"lc_vec backend '{backend}': not installed, skipped")
+            continue
+        if backend == 'jax':
+            import jax
+            jax.config.update('jax_enable_x64', True)
+        v = lc_vec(aa, 0.5, jj, backend=backend)
+        v = v.get() if backend == 'cupy' else np.asarray(v)
+        err = np.max(np.abs(v/ref - 1))
+        print(f"lc_vec backend '{backend}': max relative difference to numpy {err:.1e}")
+        assert err < 1e-10
+    print()